@@ -1,30 +1,200 @@
 import requests
-from bs4 import BeautifulSoup
-import json
+import requests_cache
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml  # noqa: F401 - fail fast if the lxml parser backend is missing
+import charset_normalizer  # noqa: F401 - encoding detection for raw response bytes
+import orjson
+import html
 import os
 from PIL import Image
 import io
 from tqdm import tqdm
 import img2pdf
 import time
+import asyncio
+import contextlib
+import threading
 import argparse
 import logging
 import random
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import unicodedata
 import re
+import sys
+from urllib.parse import urlsplit
 
 
 logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+IMAGE_HOST = 'image.isu.pub'
+
+# Bulkheads: cap in-flight requests per downstream host so that page image
+# downloads can't starve publication discovery on issuu.com
+IMAGE_HOST_CONCURRENCY = 32
+METADATA_CONCURRENCY = 4
+IMAGE_HOST_SEMAPHORE = threading.BoundedSemaphore(IMAGE_HOST_CONCURRENCY)
+METADATA_SEMAPHORE = threading.BoundedSemaphore(METADATA_CONCURRENCY)
+
+# (connect, read) timeout in seconds applied to every request
+HTTP_TIMEOUT = (5, 30)
+
+# Responses worth retrying, and the retry budget for page images
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+IMAGE_MAX_RETRIES = 5
+IMAGE_BACKOFF_BASE = 1.0
+IMAGE_BACKOFF_CAP = 30.0
+
+HTTP_CACHE_NAME = os.path.join('data', 'http_cache')
+# Cache the issuu.com HTML pages; page images are only fetched once per run
+HTTP_CACHE_EXPIRY = {
+    'image.isu.pub': requests_cache.DO_NOT_CACHE,
+    'issuu.com': 3600,
+}
+
+# Characters that are unsafe in filenames and their replacements, applied
+# in a single pass by sanitize_filename
+SANITIZE_TABLE = str.maketrans({
+    '<': '(',
+    '>': ')',
+    ':': '-',
+    '"': "'",
+    '/': '-',
+    '\\': '-',
+    '|': '-',
+    '?': '',
+    '*': '',
+    '&': 'and',
+    '#': 'No.',
+    '%': 'pct',
+    '{': '(',
+    '}': ')',
+    '~': '-',
+    '+': 'plus',
+    '@': 'at',
+    '!': '',
+    '`': "'",
+    '=': '-',
+    ';': ',',
+    '[': '(',
+    ']': ')',
+    ' ': '_'  # Replace spaces with underscores
+})
+MULTIPLE_UNDERSCORES = re.compile(r'_+')
+MULTIPLE_DASHES = re.compile(r'-+')
+INITIAL_DATA_PATTERN = re.compile(rb'<script[^>]*id="initial-data"[^>]*data-json="([^"]*)"')
+PUBLICATION_CARD_STRAINER = SoupStrainer('div', attrs={'data-testid': 'publication-card'})
+
+class JitteredRetry(Retry):
+    """Retry policy using exponential backoff with full jitter."""
+
+    def get_backoff_time(self):
+        # Spread retries uniformly over [0, exponential backoff] so parallel
+        # workers hitting the same error don't retry in lockstep.
+        backoff = super().get_backoff_time()
+        return random.uniform(0, backoff) if backoff > 0 else 0
+
+
+def full_jitter_backoff(attempt, base=IMAGE_BACKOFF_BASE, cap=IMAGE_BACKOFF_CAP):
+    """Seconds to wait before retry number attempt (0-based), drawn with full jitter."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def publication_link_selector(handle):
+    """CSS selector for relative links to a handle's publications, excluding the /docs/ index."""
+    return f'a[href*="/{handle}/docs/"]:not([href$="/docs/"]):not([href*="http"])'
+
+
+@contextlib.asynccontextmanager
+async def image_host_slot():
+    """Hold a slot of the image host bulkhead without blocking the event loop.
+
+    The bulkhead is shared by the event loops of all publication workers,
+    so it is a thread semaphore; when no slot is free, the wait happens in
+    the loop's default executor.
+    """
+    if not IMAGE_HOST_SEMAPHORE.acquire(blocking=False):
+        acquired = asyncio.get_running_loop().run_in_executor(None, IMAGE_HOST_SEMAPHORE.acquire)
+        try:
+            await asyncio.shield(acquired)
+        except asyncio.CancelledError:
+            # The executor thread still takes the slot; give it back when it does
+            acquired.add_done_callback(lambda _: IMAGE_HOST_SEMAPHORE.release())
+            raise
+    try:
+        yield
+    finally:
+        IMAGE_HOST_SEMAPHORE.release()
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because its host's circuit is open."""
+
+
+class CircuitBreaker:
+    """Fail fast against a host after repeated consecutive failures.
+
+    CLOSED lets requests through. After failure_threshold consecutive
+    failures the breaker goes OPEN and refuses requests for reset_timeout
+    seconds, then goes HALF_OPEN and lets a single probe through: a success
+    closes it again, a failure re-opens it.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=10, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow_request(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def seconds_until_probe(self):
+        """Seconds until an OPEN breaker lets a probe through, 0 if it would now."""
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"Circuit opened after {self.failures} consecutive failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
 class IssuuScraper:
     def __init__(self, max_workers=10):
         self.max_workers = max_workers
         self.session = self._create_session()
+        self._document_data_cache = {}
+        self._circuit_breakers = {}
+        self._circuit_breakers_lock = threading.Lock()
+        # time.monotonic() before which no image request is sent, set on 429s
+        self._image_host_paused_until = 0.0
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
@@ -33,36 +203,89 @@ class IssuuScraper:
             'Connection': 'keep-alive',
             'Referer': 'https://issuu.com/',
         }
+        self.image_headers = self.headers.copy()
+        self.image_headers.update({
+            'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
+        })
+        # Connection-specific headers are not allowed over HTTP/2
+        del self.image_headers['Connection']
 
     def _create_session(self):
-        session = requests.Session()
+        session = requests_cache.CachedSession(
+            cache_name=HTTP_CACHE_NAME,
+            backend='sqlite',
+            expire_after=3600,
+            urls_expire_after=HTTP_CACHE_EXPIRY,
+            allowable_methods=['GET'],
+            allowable_codes=[200],
+        )
         
         # Configure retry strategy
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
+        # Read timeouts aren't retried so a stalled page can't hold a
+        # metadata slot for minutes; connection failures get a couple of tries
+        retry_strategy = JitteredRetry(
+            total=5,
+            connect=2,
+            read=False,
+            backoff_factor=1.0,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=True,
+            allowed_methods={'GET'},
+            raise_on_status=False,
         )
         
-        # Mount the adapter with retry strategy for both HTTP and HTTPS
-        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=self.max_workers)
+        # Mount the adapter with retry strategy for both HTTP and HTTPS.
+        # The session only serves issuu.com metadata, so the pool matches the
+        # metadata bulkhead and blocks rather than opening connections it
+        # would throw away when full.
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=self.max_workers,
+            pool_maxsize=METADATA_CONCURRENCY,
+            pool_block=True,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
         return session
 
+    def _create_image_client(self):
+        """HTTP/2 client for page images, multiplexing requests over few connections."""
+        connect_timeout, read_timeout = HTTP_TIMEOUT
+        return httpx.AsyncClient(
+            http2=True,
+            headers=self.image_headers,
+            limits=httpx.Limits(
+                max_keepalive_connections=IMAGE_HOST_CONCURRENCY,
+                max_connections=IMAGE_HOST_CONCURRENCY * 2,
+            ),
+            timeout=httpx.Timeout(connect_timeout, read=read_timeout),
+        )
+
     def get_document_data(self, url):
-        """Extract document data including ID and page count."""
+        """Extract document data including ID and page count.
+
+        Successful lookups are memoized per scraper instance.
+        """
+        if url in self._document_data_cache:
+            return self._document_data_cache[url]
+
+        doc_data = self._fetch_document_data(url)
+        if doc_data:
+            self._document_data_cache[url] = doc_data
+        return doc_data
+
+    def _fetch_document_data(self, url):
         try:
             logger.info(f"Fetching document data from URL: {url}")
-            response = self.session.get(url, headers=self.headers)
+            with METADATA_SEMAPHORE:
+                response = self.session.get(url, headers=self.headers, timeout=HTTP_TIMEOUT)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            initial_data = soup.find('script', {'id': 'initial-data'})
+            initial_data = self._extract_initial_data(response.content)
             
-            if initial_data and initial_data.get('data-json'):
-                data = json.loads(initial_data['data-json'])
+            if initial_data:
+                data = orjson.loads(initial_data)
                 doc_data = data.get('initialDocumentData', {}).get('document', {})
                 
                 if doc_data:
@@ -81,59 +304,209 @@ class IssuuScraper:
             logger.error("Could not find initial-data script tag or data-json attribute")
             raise ValueError("Could not find document data")
             
+        except requests.exceptions.Timeout as e:
+            logger.warning(f"Timed out getting document data from {url}, will retry on a later run: {str(e)}")
+            return None
         except Exception as e:
             logger.error(f"Error getting document data: {str(e)}")
             logger.error(f"URL was: {url}")
             return None
 
-    def download_page_image(self, doc_id, revision_id, page_num, output_path):
-        """Download a single page image."""
+    def _extract_initial_data(self, content):
+        """Return the data-json attribute of the initial-data script tag, or None."""
+        # Fast path: pull the attribute out of the raw HTML without building a DOM
+        match = INITIAL_DATA_PATTERN.search(content)
+        if match:
+            return html.unescape(match.group(1).decode('utf-8'))
+        
+        soup = BeautifulSoup(content, 'lxml')
+        initial_data = soup.find('script', {'id': 'initial-data'})
+        if initial_data:
+            return initial_data.get('data-json')
+        return None
+
+    async def _download_pages_async(self, doc_id, revision_id, page_nums, pages, progress=None, concurrency=None):
+        """Download pages concurrently on one event loop, storing each in pages[page_num - 1].
+
+        Returns (failed_pages, host_failed_pages): the page numbers that could
+        not be downloaded, and the subset that failed because the image host
+        was unavailable (circuit open or RETRY_STATUSES) rather than for a
+        page-specific reason. If given, progress is called with the number of
+        pages completed so far after each successful download. concurrency
+        defaults to max_workers.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.max_workers)
+        failed_pages = []
+        host_failed_pages = []
+        url_prefix = f"https://{IMAGE_HOST}/{revision_id}-{doc_id}/jpg/page_"
+        
+        async with self._create_image_client() as client:
+            tasks = [
+                self._fetch_page(client, semaphore, page_num, f"{url_prefix}{page_num}.jpg")
+                for page_num in page_nums
+            ]
+            completed = tqdm(
+                asyncio.as_completed(tasks),
+                total=len(tasks),
+                unit='page',
+                disable=not sys.stderr.isatty()
+            )
+            for i, task in enumerate(completed, 1):
+                page_num, page, host_failed = await task
+                if page is not None:
+                    pages[page_num - 1] = page
+                    if progress:
+                        progress(i)
+                else:
+                    failed_pages.append(page_num)
+                    if host_failed:
+                        host_failed_pages.append(page_num)
+                    logger.debug("Failed to download page %s", page_num)
+        
+        if failed_pages:
+            logger.warning("Failed pages: %s", sorted(failed_pages))
+        return failed_pages, host_failed_pages
+
+    async def _fetch_page(self, client, semaphore, page_num, image_url):
+        """Download a single page image.
+
+        Returns (page_num, JPEG bytes or None on failure, host_failed), where
+        host_failed is True if the failure was down to the image host being
+        unavailable rather than to this page.
+        """
         try:
-            image_url = f"https://image.isu.pub/{revision_id}-{doc_id}/jpg/page_{page_num}.jpg"
-            
-            # Add randomized delay between 0.1 and 0.3 seconds
-            time.sleep(random.uniform(0.1, 0.3))
-            
-            image_headers = self.headers.copy()
-            image_headers.update({
-                'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
-            })
-            
-            response = self.session.get(image_url, headers=image_headers)
+            # Keep the JPEG as served; decoding and re-encoding it is only
+            # needed if img2pdf later rejects it (see create_pdf).
+            async with semaphore:
+                response = await self._get_image(client, image_url)
             response.raise_for_status()
-            
-            img = Image.open(io.BytesIO(response.content))
-            img.save(output_path, 'JPEG', quality=95)
-            return True
+            return page_num, response.content, False
             
         except Exception as e:
-            logger.error(f"Error downloading page {page_num}: {str(e)}")
-            return False
+            logger.debug("Error downloading page %s: %s", page_num, e)
+            if isinstance(e, httpx.HTTPStatusError):
+                # Still rate limited after retries - hold off every image request
+                if e.response.status_code == 429:
+                    self._pause_image_host(self._retry_after(e.response))
+                return page_num, None, e.response.status_code in RETRY_STATUSES
+            return page_num, None, isinstance(e, CircuitOpenError)
 
-    def download_page_batch(self, args):
-        """Helper function for parallel downloads."""
-        doc_id, revision_id, page_num, output_path = args
-        return page_num, self.download_page_image(doc_id, revision_id, page_num, output_path)
+    async def _get_image(self, client, image_url):
+        """GET an image through its host's circuit breaker.
 
-    def create_pdf(self, image_folder, output_pdf):
-        """Create PDF from downloaded images."""
+        Like urllib3's Retry under the requests session, the breaker sees one
+        outcome per image, once its retries are used up, not every attempt.
+        """
+        host = urlsplit(image_url).hostname
+        breaker = self._circuit_breaker(host)
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"Circuit open for {host}")
+        
         try:
-            image_files = sorted([os.path.join(image_folder, f) for f in os.listdir(image_folder) 
-                                if f.endswith('.jpg')])
+            response = await self._get_image_with_retries(client, image_url)
+        except BaseException:
+            # Any outcome, including cancellation, must be recorded, or a
+            # HALF_OPEN probe would leave the breaker refusing requests forever
+            breaker.record_failure()
+            raise
+        
+        if response.status_code in RETRY_STATUSES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    async def _get_image_with_retries(self, client, image_url):
+        """GET an image, retrying transport errors (except timeouts) and RETRY_STATUSES with full jitter backoff."""
+        for attempt in range(IMAGE_MAX_RETRIES + 1):
+            delay = self._image_host_paused_until - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
             
-            if not image_files:
+            try:
+                async with image_host_slot():
+                    response = await client.get(image_url)
+            except httpx.TimeoutException:
+                # Don't tie up a slot retrying a stalled page; it still counts
+                # toward the circuit breaker and is retried in the failed-pages pass
+                raise
+            except httpx.TransportError:
+                if attempt == IMAGE_MAX_RETRIES:
+                    raise
+                await asyncio.sleep(full_jitter_backoff(attempt))
+                continue
+            
+            if response.status_code not in RETRY_STATUSES or attempt == IMAGE_MAX_RETRIES:
+                return response
+            if response.status_code == 429:
+                # Rate limits apply to the whole host, so pause all requests
+                self._pause_image_host(self._retry_after(response))
+            elif 'Retry-After' in response.headers:
+                await asyncio.sleep(self._retry_after(response))
+            else:
+                await asyncio.sleep(full_jitter_backoff(attempt))
+
+    def _pause_image_host(self, seconds):
+        """Hold off all image requests, across every publication, for the given seconds."""
+        self._image_host_paused_until = max(self._image_host_paused_until, time.monotonic() + seconds)
+
+    def _circuit_breaker(self, host):
+        """Return the circuit breaker for a host, creating it on first use."""
+        with self._circuit_breakers_lock:
+            if host not in self._circuit_breakers:
+                self._circuit_breakers[host] = CircuitBreaker()
+            return self._circuit_breakers[host]
+
+    def _retry_after(self, response, default=5.0, cap=60.0):
+        """Seconds to wait according to a response's Retry-After header."""
+        try:
+            return min(float(response.headers.get('Retry-After', default)), cap)
+        except ValueError:
+            return default
+
+    def save_page_images(self, pages, images_dir):
+        """Write downloaded page images to disk as page_XXX.jpg."""
+        os.makedirs(images_dir, exist_ok=True)
+        paths = [os.path.join(images_dir, f"page_{page_num:03d}.jpg") for page_num in range(1, len(pages) + 1)]
+        for path, page in zip(paths, pages):
+            if page is not None:
+                with open(path, 'wb') as f:
+                    f.write(page)
+
+    def create_pdf(self, pages, output_pdf):
+        """Create PDF from downloaded page images, given as JPEG bytes in page order."""
+        try:
+            pages = [page for page in pages if page is not None]
+            
+            if not pages:
                 logger.error("No images found to create PDF")
                 return False
                 
-            logger.info(f"Creating PDF from {len(image_files)} images")
+            logger.info(f"Creating PDF from {len(pages)} images")
+            try:
+                pdf_bytes = img2pdf.convert(pages)
+            except Exception as e:
+                logger.warning(f"img2pdf rejected the downloaded images ({str(e)}), re-encoding them")
+                pdf_bytes = img2pdf.convert(self._reencode_images(pages))
+            
             with open(output_pdf, 'wb') as pdf_file:
-                pdf_file.write(img2pdf.convert(image_files))
+                pdf_file.write(pdf_bytes)
             return True
             
         except Exception as e:
             logger.error(f"Error creating PDF: {str(e)}")
             return False
 
+    def _reencode_images(self, pages):
+        """Re-encode images through PIL as plain RGB JPEGs that img2pdf accepts."""
+        reencoded = []
+        for page in pages:
+            with Image.open(io.BytesIO(page)) as img:
+                buffer = io.BytesIO()
+                img.convert('RGB').save(buffer, 'JPEG', quality=95)
+            reencoded.append(buffer.getvalue())
+        return reencoded
+
     def sanitize_filename(self, filename):
         """
         Sanitize the filename by removing/replacing invalid characters.
@@ -149,42 +522,15 @@ class IssuuScraper:
         filename = ''.join(c for c in filename if not unicodedata.combining(c))
         
         # Step 2: Replace specific characters with safe alternatives
-        char_map = {
-            '<': '(',
-            '>': ')',
-            ':': '-',
-            '"': "'",
-            '/': '-',
-            '\\': '-',
-            '|': '-',
-            '?': '',
-            '*': '',
-            '&': 'and',
-            '#': 'No.',
-            '%': 'pct',
-            '{': '(',
-            '}': ')',
-            '~': '-',
-            '+': 'plus',
-            '@': 'at',
-            '!': '',
-            '`': "'",
-            '=': '-',
-            ';': ',',
-            '[': '(',
-            ']': ')',
-            ' ': '_'  # Replace spaces with underscores
-        }
-        
-        for char, replacement in char_map.items():
-            filename = filename.replace(char, replacement)
+        filename = filename.translate(SANITIZE_TABLE)
         
         # Step 3: Remove any other non-printable characters and control characters
-        filename = ''.join(char for char in filename if char.isprintable())
+        if not filename.isprintable():
+            filename = ''.join(char for char in filename if char.isprintable())
         
         # Step 4: Replace multiple underscores/dashes with single ones
-        filename = re.sub(r'_+', '_', filename)  # Multiple underscores to single underscore
-        filename = re.sub(r'-+', '-', filename)  # Multiple dashes to single dash
+        filename = MULTIPLE_UNDERSCORES.sub('_', filename)
+        filename = MULTIPLE_DASHES.sub('-', filename)
         
         # Step 5: Strip underscores and dashes from beginning and end
         filename = filename.strip('_-')
@@ -200,10 +546,16 @@ class IssuuScraper:
             
         return filename
 
-    def scrape_publication(self, handle, pub_url, progress_callback=None):
-        """Scrape a single publication."""
+    def scrape_publication(self, handle, pub_url, progress_callback=None, save_images=False, doc_data=None):
+        """Scrape a single publication.
+
+        Pages are kept in memory and assembled into the PDF directly; pass
+        save_images=True to also write them to downloads/.../images. Pass
+        doc_data from get_document_data to skip fetching it again.
+        """
         try:
-            doc_data = self.get_document_data(pub_url)
+            if doc_data is None:
+                doc_data = self.get_document_data(pub_url)
             if not doc_data or not doc_data['publication_id']:
                 logger.error("Could not get publication data")
                 return False
@@ -223,58 +575,63 @@ class IssuuScraper:
             # Create output directories
             base_dir = f"downloads/{handle}/{publication_id}"
             images_dir = f"{base_dir}/images"
-            os.makedirs(images_dir, exist_ok=True)
+            os.makedirs(base_dir, exist_ok=True)
             
-            # Download pages in parallel
-            successful_downloads = 0
-            failed_pages = []
+            # Download pages concurrently, slotting each into its page position
+            pages = [None] * page_count
             
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = []
-                for page_num in range(1, page_count + 1):
-                    output_path = f"{images_dir}/page_{page_num:03d}.jpg"
-                    futures.append(
-                        executor.submit(
-                            self.download_page_image,
-                            doc_id=publication_id,
-                            revision_id=revision_id,
-                            page_num=page_num,
-                            output_path=output_path
-                        )
-                    )
-                
-                for i, future in enumerate(as_completed(futures), 1):
-                    success = future.result()
-                    if success:
-                        successful_downloads += 1
-                        if progress_callback:
-                            progress_callback(original_title, i, page_count, "downloading")
-                    else:
-                        failed_pages.append(i)
-                        logger.error(f"Failed to download page {i}")
+            def report_progress(completed):
+                progress_callback(original_title, completed, page_count, "downloading")
+            
+            failed_pages, _ = asyncio.run(self._download_pages_async(
+                publication_id,
+                revision_id,
+                range(1, page_count + 1),
+                pages,
+                progress=report_progress if progress_callback else None
+            ))
+            successful_downloads = page_count - len(failed_pages)
 
             if successful_downloads == 0:
                 logger.error("No pages were downloaded successfully")
                 return False
 
-            # Retry failed pages
+            # Retry failed pages one at a time, once the image host's circuit
+            # lets requests through again, so the first retry acts as its probe
             if failed_pages:
+                delay = self._circuit_breaker(IMAGE_HOST).seconds_until_probe()
+                if delay:
+                    logger.info(f"Waiting {delay:.0f}s for the {IMAGE_HOST} circuit to close")
+                    time.sleep(delay)
+                
                 logger.info(f"Retrying {len(failed_pages)} failed pages")
-                for page_num in failed_pages:
-                    output_path = f"{images_dir}/page_{page_num:03d}.jpg"
-                    success = self.download_page_image(
-                        publication_id, 
-                        revision_id,
-                        page_num,
-                        output_path
-                    )
-                    if success:
-                        successful_downloads += 1
-
-            # Create PDF with handle-prefixed filename
+                still_failed, host_failed = asyncio.run(self._download_pages_async(
+                    publication_id,
+                    revision_id,
+                    sorted(failed_pages),
+                    pages,
+                    concurrency=1
+                ))
+                
+                # Don't build a book that is only partial because the host was
+                # down - it would be recorded as processed and never fetched again
+                if host_failed:
+                    logger.error(f"Could not download {len(host_failed)} of {page_count} pages, {IMAGE_HOST} unavailable")
+                    return False
+                if still_failed:
+                    logger.warning(f"Building PDF without pages: {sorted(still_failed)}")
+                successful_downloads += len(failed_pages) - len(still_failed)
+
+            # Create PDF with handle-prefixed filename, writing the page
+            # images in the background if they should be kept as well
             if successful_downloads > 0:
                 pdf_path = f"{base_dir}/{sanitized_title}.pdf"
-                pdf_created = self.create_pdf(images_dir, pdf_path)
+                with ThreadPoolExecutor(max_workers=1) as image_writer:
+                    if save_images:
+                        images_saved = image_writer.submit(self.save_page_images, pages, images_dir)
+                    pdf_created = self.create_pdf(pages, pdf_path)
+                    if save_images:
+                        images_saved.result()
                 
                 if pdf_created:
                     logger.info(f"Successfully created PDF: {pdf_path}")
@@ -292,6 +649,7 @@ class IssuuScraper:
         """Get publication URLs with pagination support."""
         base_url = f"https://issuu.com/{handle}"
         pub_urls = []
+        seen = set()
         page = 1
         
         while len(pub_urls) < num_publications:
@@ -302,11 +660,13 @@ class IssuuScraper:
                     url = f"{base_url}?page={page}"
                     
                 logger.info(f"Fetching page {page} from {url}")
-                response = self.session.get(url, headers=self.headers)
+                with METADATA_SEMAPHORE:
+                    response = self.session.get(url, headers=self.headers, timeout=HTTP_TIMEOUT)
                 response.raise_for_status()
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                pub_cards = soup.find_all('div', {'data-testid': 'publication-card'})
+                # Only build the tree for the publication cards
+                soup = BeautifulSoup(response.content, 'lxml', parse_only=PUBLICATION_CARD_STRAINER)
+                pub_cards = soup.select('div[data-testid="publication-card"]')
                 
                 if not pub_cards:
                     logger.info(f"No more publications found on page {page}")
@@ -314,11 +674,13 @@ class IssuuScraper:
                     
                 logger.info(f"Found {len(pub_cards)} publication cards on page {page}")
                 
+                link_selector = publication_link_selector(handle)
                 for card in pub_cards:
-                    link = card.find('a', href=lambda x: x and f'/{handle}/docs/' in x)
-                    if link and not link['href'].endswith('/docs/') and 'http' not in link['href']:
+                    link = card.select_one(link_selector)
+                    if link:
                         full_url = f"https://issuu.com{link['href']}"
-                        if full_url not in pub_urls:  # Avoid duplicates
+                        if full_url not in seen:  # Avoid duplicates
+                            seen.add(full_url)
                             pub_urls.append(full_url)
                             if len(pub_urls) >= num_publications:
                                 break
@@ -327,6 +689,9 @@ class IssuuScraper:
                 # Add a small delay between page requests
                 time.sleep(random.uniform(1, 2))
                 
+            except requests.exceptions.Timeout as e:
+                logger.warning(f"Timed out getting publications on page {page}, will retry on a later run: {str(e)}")
+                break
             except Exception as e:
                 logger.error(f"Error getting publications on page {page}: {str(e)}")
                 break
@@ -339,6 +704,7 @@ def main():
     parser.add_argument('handle', help='Issuu user handle')
     parser.add_argument('n', type=int, help='Number of books to download')
     parser.add_argument('--workers', type=int, default=10, help='Number of concurrent downloads')
+    parser.add_argument('--save-images', action='store_true', help='Also keep the page images on disk')
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
     args = parser.parse_args()
 
@@ -349,14 +715,14 @@ def main():
     base_url = f"https://issuu.com/{args.handle}"
     
     try:
-        response = requests.get(base_url, headers=scraper.headers)
+        with METADATA_SEMAPHORE:
+            response = scraper.session.get(base_url, headers=scraper.headers, timeout=HTTP_TIMEOUT)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        pub_links = soup.find_all('a', href=lambda x: x and f'/{args.handle}/docs/' in x)
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=SoupStrainer('a'))
+        pub_links = soup.select(publication_link_selector(args.handle))
         
-        pub_urls = list(set([f"https://issuu.com{link['href']}" for link in pub_links 
-                           if not link['href'].endswith('/docs/') and 'http' not in link['href']]))
+        pub_urls = list(set([f"https://issuu.com{link['href']}" for link in pub_links]))
         
         if not pub_urls:
             logger.error("No publications found. Check the handle.")
@@ -367,7 +733,7 @@ def main():
         
         for pub_url in pub_urls:
             logger.info(f"Processing publication: {pub_url}")
-            if scraper.scrape_publication(args.handle, pub_url):
+            if scraper.scrape_publication(args.handle, pub_url, save_images=args.save_images):
                 logger.info(f"Successfully downloaded: {pub_url}")
             else:
                 logger.error(f"Failed to download: {pub_url}")
@@ -1,14 +1,19 @@
 import os
-import json
+import orjson
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 from datetime import timezone
+from urllib.parse import urlparse
 from dateutil.parser import parse
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaFileUpload, set_user_agent
+import google_auth_httplib2
+import httplib2
 from issuu_scraper import IssuuScraper
 import logging
 
@@ -20,45 +25,105 @@ logger = logging.getLogger(__name__)
 
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 CUTOFF_DATE = datetime(2025, 2, 18, tzinfo=timezone.utc)
-PROCESSED_PUBS_FILE = os.path.join('data', 'processed_publications.json')
+PROCESSED_PUBS_FILE = os.path.join('data', 'processed_publications.ndjson')
+LEGACY_PROCESSED_PUBS_FILE = os.path.join('data', 'processed_publications.json')
 CONFIG_FILE = 'config.json'
+GOOGLE_HTTP_CACHE = '.google_http_cache'
+USER_AGENT = 'issuu-scraper'
+# Upload PDFs in resumable chunks so a failed chunk is retried on its own
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+UPLOAD_NUM_RETRIES = 3
+# Publications are scraped in parallel, each with its own page download pool,
+# so keep both small to stay within what Issuu tolerates per client.
+PUBLICATION_WORKERS = 4
+PAGE_WORKERS = 4
+
+state_lock = threading.Lock()
+# publication_id -> record, populated by load_processed_publications()
+processed_publications = {}
+# (handle, slug) of processed publications, so known URLs can be skipped
+# without fetching them
+processed_slugs = set()
 
 def load_config():
-    with open(CONFIG_FILE, 'r') as f:
-        return json.load(f)
+    with open(CONFIG_FILE, 'rb') as f:
+        return orjson.loads(f.read())
 
 def load_processed_publications():
+    """Load the processed publications log into memory, keyed by publication ID.
+
+    New records are appended to the NDJSON log by save_processed_publication.
+    A legacy JSON file, if present, is migrated into the log first.
+    """
+    processed_publications.clear()
+    processed_slugs.clear()
+    
     try:
-        with open(PROCESSED_PUBS_FILE, 'r') as f:
-            try:
-                return json.load(f)
-            except json.JSONDecodeError:
-                logger.warning(f"Could not parse {PROCESSED_PUBS_FILE}, creating new file")
-                default_data = {"processed_publications": []}
-                with open(PROCESSED_PUBS_FILE, 'w') as f:
-                    json.dump(default_data, f, indent=2)
-                return default_data
+        with open(PROCESSED_PUBS_FILE, 'rb') as f:
+            for line_num, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    pub = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    logger.warning(f"Skipping unparseable line {line_num} in {PROCESSED_PUBS_FILE}")
+                    continue
+                _remember_processed(pub)
     except FileNotFoundError:
         logger.warning(f"{PROCESSED_PUBS_FILE} not found, creating new file")
-        default_data = {"processed_publications": []}
         os.makedirs(os.path.dirname(PROCESSED_PUBS_FILE), exist_ok=True)
-        with open(PROCESSED_PUBS_FILE, 'w') as f:
-            json.dump(default_data, f, indent=2)
-        return default_data
+        open(PROCESSED_PUBS_FILE, 'a').close()
+    
+    migrate_legacy_processed_publications()
+    
+    logger.info(f"Loaded {len(processed_publications)} processed publications")
+    return processed_publications
 
-def save_processed_publication(pub_id, metadata):
-    data = load_processed_publications()
-    data["processed_publications"].append({
+def migrate_legacy_processed_publications():
+    """Append records from the legacy JSON file to the NDJSON log, then remove it."""
+    try:
+        with open(LEGACY_PROCESSED_PUBS_FILE, 'rb') as f:
+            legacy = orjson.loads(f.read()).get("processed_publications", [])
+    except FileNotFoundError:
+        return
+    except orjson.JSONDecodeError:
+        logger.warning(f"Could not parse {LEGACY_PROCESSED_PUBS_FILE}, leaving it unmigrated")
+        return
+    
+    migrated = [pub for pub in legacy if pub["publication_id"] not in processed_publications]
+    with open(PROCESSED_PUBS_FILE, 'ab') as f:
+        for pub in migrated:
+            f.write(orjson.dumps(pub, option=orjson.OPT_APPEND_NEWLINE))
+            _remember_processed(pub)
+    os.remove(LEGACY_PROCESSED_PUBS_FILE)
+    logger.info(f"Migrated {len(migrated)} records from {LEGACY_PROCESSED_PUBS_FILE} to {PROCESSED_PUBS_FILE}")
+
+def _remember_processed(record):
+    processed_publications[record["publication_id"]] = record
+    if record.get("handle") and record.get("slug"):
+        processed_slugs.add((record["handle"], record["slug"]))
+
+def publication_slug(pub_url):
+    """Return the document slug of an issuu URL (https://issuu.com/{handle}/docs/{slug})."""
+    return urlparse(pub_url).path.rsplit('/docs/', 1)[-1].strip('/')
+
+def save_processed_publication(pub_id, metadata, handle=None, slug=None):
+    record = {
         "publication_id": pub_id,
+        "handle": handle,
+        "slug": slug,
         "metadata": metadata,
         "processed_at": datetime.now().isoformat()
-    })
-    with open(PROCESSED_PUBS_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    }
+    with open(PROCESSED_PUBS_FILE, 'ab') as f:
+        f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+    _remember_processed(record)
 
 def is_publication_processed(pub_id):
-    data = load_processed_publications()
-    return any(pub["publication_id"] == pub_id for pub in data["processed_publications"])
+    return pub_id in processed_publications
+
+def is_slug_processed(handle, slug):
+    return (handle, slug) in processed_slugs
 
 def get_google_drive_service():
     try:
@@ -66,7 +131,11 @@ def get_google_drive_service():
             'credentials.json', 
             scopes=['https://www.googleapis.com/auth/drive']  # Updated scope for full drive access
         )
-        return build('drive', 'v3', credentials=credentials)
+        # One authorized HTTP client for all Drive calls, so connections and
+        # cached discovery responses are reused across requests
+        http = set_user_agent(httplib2.Http(cache=GOOGLE_HTTP_CACHE), USER_AGENT)
+        authorized_http = google_auth_httplib2.AuthorizedHttp(credentials, http=http)
+        return build('drive', 'v3', http=authorized_http)
     except Exception as e:
         logger.error(f"Error creating Drive service: {str(e)}")
         raise
@@ -78,13 +147,23 @@ def upload_to_drive(service, file_path, folder_id):
             'parents': [folder_id],
             'supportsAllDrives': True  # Enable shared drive support
         }
-        media = MediaFileUpload(file_path, mimetype='application/pdf')
-        file = service.files().create(
+        media = MediaFileUpload(
+            file_path,
+            mimetype='application/pdf',
+            resumable=True,
+            chunksize=UPLOAD_CHUNK_SIZE
+        )
+        request = service.files().create(
             body=file_metadata,
             media_body=media,
             supportsAllDrives=True,  # Enable shared drive support
             fields='id, webViewLink'
-        ).execute()
+        )
+        file = None
+        while file is None:
+            status, file = request.next_chunk(num_retries=UPLOAD_NUM_RETRIES)
+            if status:
+                logger.debug(f"Uploaded {int(status.progress() * 100)}% of {os.path.basename(file_path)}")
         logger.info(f"Successfully uploaded file: {file.get('webViewLink')}")
         return file.get('id'), file.get('webViewLink')
     except Exception as e:
@@ -152,12 +231,79 @@ def send_email(subject, body, config):
         # This prevents email errors from stopping the main workflow
         pass
 
+def process_publication(scraper, drive_service, folder_id, handle, pub_url):
+    """Download and upload a single publication if it is new.
+
+    Returns the book info for a newly processed publication, otherwise None.
+    """
+    # Skip known publications before making any request
+    slug = publication_slug(pub_url)
+    if is_slug_processed(handle, slug):
+        logger.info(f"Publication {handle}/{slug} already processed, skipping")
+        return None
+    
+    doc_data = scraper.get_document_data(pub_url)
+    if not doc_data:
+        logger.warning(f"Could not get document data for {pub_url}")
+        return None
+    
+    pub_id = doc_data['publication_id']
+    
+    # Skip if already processed
+    if is_publication_processed(pub_id):
+        logger.info(f"Publication {pub_id} already processed, skipping")
+        return None
+    
+    # Check publication date
+    logger.info("Document data: %s", doc_data)
+    pub_date_str = doc_data.get('originalPublishDateInISOString')
+    if not pub_date_str:
+        logger.warning(f"No publication date found for {doc_data.get('title', 'Unknown title')}")
+        return None
+    
+    logger.info(f"Found publication date: {pub_date_str}")
+    pub_date = parse(pub_date_str)
+    if pub_date <= CUTOFF_DATE:
+        logger.info(f"Publication {pub_id} is before cutoff date, skipping")
+        return None
+    
+    # Download the publication
+    logger.info(f"Downloading publication: {doc_data['title']}")
+    if not scraper.scrape_publication(handle, pub_url, doc_data=doc_data):
+        return None
+    
+    # Use the same sanitized filename format as in scrape_publication
+    sanitized_title = scraper.sanitize_filename(f"{handle}_{doc_data['title']}")
+    pdf_path = f"downloads/{handle}/{pub_id}/{sanitized_title}.pdf"
+    
+    book_info = {
+        'title': doc_data['title'],
+        'handle': handle,
+        'publish_date': pub_date.strftime('%Y-%m-%d'),
+        'page_count': doc_data['page_count'],
+        'publication_id': pub_id,
+    }
+    
+    # The Drive client and the processed log are shared between workers
+    with state_lock:
+        # Upload to Google Drive
+        file_id, web_link = upload_to_drive(drive_service, pdf_path, folder_id)
+        book_info['drive_link'] = web_link
+        
+        # Save to processed publications
+        save_processed_publication(pub_id, book_info, handle, slug)
+    
+    logger.info(f"Successfully processed: {doc_data['title']}")
+    return book_info
+
 def main():
     logger.info("Starting scraper job")
     try:
         config = load_config()
         logger.info("Config loaded successfully")
         
+        load_processed_publications()
+        
         # Initialize services
         drive_service = get_google_drive_service()
         logger.info("Google Drive service initialized")
@@ -165,7 +311,7 @@ def main():
         if not verify_folder_access(drive_service, config['google_drive_folder_id']):
             raise Exception("Cannot access the specified Google Drive folder.")
         
-        scraper = IssuuScraper()
+        scraper = IssuuScraper(max_workers=PAGE_WORKERS)
         new_books = []
         
         for handle in config['issuu_handles']:
@@ -173,62 +319,23 @@ def main():
             publications = scraper.get_publications(handle, 10)
             logger.info(f"Found {len(publications)} publications for {handle}")
             
-            for pub_url in publications:
-                doc_data = scraper.get_document_data(pub_url)
-                if not doc_data:
-                    logger.warning(f"Could not get document data for {pub_url}")
-                    continue
-                
-                pub_id = doc_data['publication_id']
-                
-                # Skip if already processed
-                if is_publication_processed(pub_id):
-                    logger.info(f"Publication {pub_id} already processed, skipping")
-                    continue
-                
-                # Check publication date
-                logger.info(f"Document data: {json.dumps(doc_data, indent=2)}")
-                pub_date_str = doc_data.get('originalPublishDateInISOString')
-                if not pub_date_str:
-                    logger.warning(f"No publication date found for {doc_data.get('title', 'Unknown title')}")
-                    continue
-                
-                logger.info(f"Found publication date: {pub_date_str}")
-                pub_date = parse(pub_date_str)
-                if pub_date <= CUTOFF_DATE:
-                    logger.info(f"Publication {pub_id} is before cutoff date, skipping")
-                    continue
-                
-                # Download the publication
-                logger.info(f"Downloading publication: {doc_data['title']}")
-                success = scraper.scrape_publication(handle, pub_url)
-                
-                if success:
-                    # Use the same sanitized filename format as in scrape_publication
-                    sanitized_title = scraper.sanitize_filename(f"{handle}_{doc_data['title']}")
-                    pdf_path = f"downloads/{handle}/{pub_id}/{sanitized_title}.pdf"
-                    
-                    # Upload to Google Drive
-                    file_id, web_link = upload_to_drive(
-                        drive_service, 
-                        pdf_path, 
-                        config['google_drive_folder_id']
+            with ThreadPoolExecutor(max_workers=PUBLICATION_WORKERS) as executor:
+                futures = [
+                    executor.submit(
+                        process_publication,
+                        scraper,
+                        drive_service,
+                        config['google_drive_folder_id'],
+                        handle,
+                        pub_url
                     )
-                    
-                    book_info = {
-                        'title': doc_data['title'],
-                        'handle': handle,
-                        'publish_date': pub_date.strftime('%Y-%m-%d'),
-                        'page_count': doc_data['page_count'],
-                        'publication_id': pub_id,
-                        'drive_link': web_link
-                    }
-                    
-                    new_books.append(book_info)
-                    
-                    # Save to processed publications
-                    save_processed_publication(pub_id, book_info)
-                    logger.info(f"Successfully processed: {doc_data['title']}")
+                    for pub_url in publications
+                ]
+                # Collect in listing order so the notification lists books as Issuu does
+                for future in futures:
+                    book_info = future.result()
+                    if book_info:
+                        new_books.append(book_info)
         
         # Send email if new books were found
         if new_books: